@@ -0,0 +1,272 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.http import HttpRequest
+from django.utils import translation
+
+from email_editor.preview import get_preview_classes
+from email_editor.settings import app_settings
+from email_editor.snapshot import MANIFEST_NAME, MANIFEST_VERSION, get_entry_key, load_manifest
+
+
+class SnapshotJSONEncoder(DjangoJSONEncoder):
+    """
+    Falls back to ``str`` for values like model instances left at the max depth of the context tree.
+    """
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+class SnapshotRequest(HttpRequest):
+    """
+    A plain GET request for the given base url, so absolute urls in the snapshot point to the real site.
+
+    The host is taken from the base url as is and not validated against ``ALLOWED_HOSTS``.
+    """
+    def __init__(self, base_url):
+        super().__init__()
+        url = urlsplit(base_url)
+        self._scheme = url.scheme or 'http'
+        self.method = 'GET'
+        self.path = self.path_info = url.path or '/'
+        self.META = {
+            'HTTP_HOST': url.netloc,
+            'SERVER_NAME': url.hostname,
+            'SERVER_PORT': str(url.port or (443 if self._scheme == 'https' else 80)),
+        }
+        self.user = AnonymousUser()
+
+    def _get_scheme(self):
+        return self._scheme
+
+    def get_host(self):
+        return self.META['HTTP_HOST']
+
+
+def get_preview_languages(cls) -> list:
+    if cls.language:
+        return [cls.language]
+    return [code for code, _ in settings.LANGUAGES]
+
+
+def get_locale_dirs() -> list:
+    """
+    Same lookup order as django's translation loading: django, installed apps, ``LOCALE_PATHS``.
+    """
+    locale_dirs = [os.path.join(os.path.dirname(django.__file__), 'conf', 'locale')]
+    locale_dirs += [os.path.join(app_config.path, 'locale') for app_config in apps.get_app_configs()]
+    locale_dirs += list(settings.LOCALE_PATHS)
+    return locale_dirs
+
+
+def get_catalog_version(language: str) -> str:
+    """
+    Hash of all compiled translation catalogs used for ``language``.
+    """
+    locales = {translation.to_locale(language), translation.to_locale(language).split('_')[0]}
+    catalog_hash = hashlib.sha256()
+    for locale_dir in get_locale_dirs():
+        for locale in sorted(locales):
+            path = os.path.join(locale_dir, locale, 'LC_MESSAGES', 'django.mo')
+            if not os.path.isfile(path):
+                continue
+            with open(path, 'rb') as file:
+                catalog_hash.update(path.encode())
+                catalog_hash.update(file.read())
+    return catalog_hash.hexdigest()
+
+
+def _hash(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _write_file(path, content):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.write(content)
+    os.replace(tmp_path, path)
+
+
+def _is_entry_current(snapshot_dir, entry, version) -> bool:
+    if not entry or entry.get('version') != version:
+        return False
+    return all(os.path.isfile(os.path.join(snapshot_dir, path)) for path in entry['files'].values())
+
+
+def _remove_entry(snapshot_dir, entry):
+    for path in entry['files'].values():
+        try:
+            os.remove(os.path.join(snapshot_dir, path))
+        except FileNotFoundError:
+            pass
+
+    # remove the language and preview directories if they are empty now
+    entry_dir = os.path.join(snapshot_dir, entry['preview'], entry['language'])
+    for directory in (entry_dir, os.path.dirname(entry_dir)):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            break
+
+
+def render_entry(snapshot_dir, name: str, cls, language: str, base_url: str, catalog_version: str,
+                 previous_entry=None, force=False):
+    """
+    Renders a single preview in the given language into the snapshot directory.
+
+    Returns a tuple ``(entry, is_rendered)``, the previous entry is kept if the version is unchanged.
+    """
+    try:
+        with translation.override(language):
+            instance = cls()
+            version = _hash('\n'.join([instance.version, language, catalog_version]))
+            if not force and _is_entry_current(snapshot_dir, previous_entry, version):
+                return previous_entry, False
+
+            html = instance.render(SnapshotRequest(base_url))
+            subject = instance.subject or ''
+            context_tree = json.dumps(instance.context_tree, cls=SnapshotJSONEncoder, indent=2)
+    finally:
+        # worker threads keep their own connections
+        connections.close_all()
+
+    entry_dir = os.path.join(name, language)
+    os.makedirs(os.path.join(snapshot_dir, entry_dir), exist_ok=True)
+
+    files = {
+        'html': os.path.join(entry_dir, 'index.html'),
+        'subject': os.path.join(entry_dir, 'subject.txt'),
+        'context_tree': os.path.join(entry_dir, 'context.json'),
+    }
+    contents = {'html': html, 'subject': subject, 'context_tree': context_tree}
+    for key, path in files.items():
+        _write_file(os.path.join(snapshot_dir, path), contents[key])
+
+    entry = {
+        'preview': name,
+        'language': language,
+        'version': version,
+        'files': files,
+        'hashes': {key: _hash(content) for key, content in contents.items()},
+    }
+    return entry, True
+
+
+def write_snapshot(snapshot_dir, base_url, workers=None, force=False) -> dict:
+    """
+    Renders all registered previews in all their languages into ``snapshot_dir``.
+
+    Only entries whose template, context version or translations changed are rendered again, unless
+    ``force`` is set. Failed entries keep their previous files, entries of unregistered previews are removed.
+    Returns a dict with the ``rendered``, ``unchanged``, ``failed`` and ``removed`` entry keys.
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    previous_entries = load_manifest(snapshot_dir)['entries']
+
+    jobs = [
+        (name, cls, language)
+        for name, cls in get_preview_classes()
+        for language in get_preview_languages(cls)
+    ]
+    catalog_versions = {language: get_catalog_version(language) for _, _, language in jobs}
+
+    entries = {}
+    result = {'rendered': [], 'unchanged': [], 'failed': [], 'removed': []}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            get_entry_key(name, language): executor.submit(
+                render_entry, snapshot_dir, name, cls, language, base_url, catalog_versions[language],
+                previous_entry=previous_entries.get(get_entry_key(name, language)),
+                force=force,
+            )
+            for name, cls, language in jobs
+        }
+
+        for key, future in futures.items():
+            try:
+                entry, is_rendered = future.result()
+            except Exception as e:
+                result['failed'].append((key, e))
+                # keep serving the last good render
+                if key in previous_entries:
+                    entries[key] = previous_entries[key]
+                continue
+
+            entries[key] = entry
+            result['rendered' if is_rendered else 'unchanged'].append(key)
+
+    for key, entry in previous_entries.items():
+        if key not in entries:
+            _remove_entry(snapshot_dir, entry)
+            result['removed'].append(key)
+
+    manifest = {'version': MANIFEST_VERSION, 'entries': entries}
+    _write_file(
+        os.path.join(snapshot_dir, MANIFEST_NAME),
+        json.dumps(manifest, indent=2, sort_keys=True)
+    )
+    return result
+
+
+class Command(BaseCommand):
+    help = 'Renders all registered email previews and languages into a static snapshot directory.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output', default=None,
+            help='Snapshot directory, defaults to the "SNAPSHOT_DIR" setting.'
+        )
+        parser.add_argument(
+            '--base-url', default=None,
+            help='Url of the site used for absolute urls in the templates, '
+                 'defaults to the "SNAPSHOT_BASE_URL" setting.'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='Number of parallel render threads.'
+        )
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Render all entries, even if their template, context version and translations did not change.'
+        )
+
+    def handle(self, *args, **options):
+        snapshot_dir = options['output'] or app_settings.SNAPSHOT_DIR
+        if not snapshot_dir:
+            raise CommandError('No snapshot directory set, use "--output" or the "SNAPSHOT_DIR" setting.')
+
+        base_url = options['base_url'] or app_settings.SNAPSHOT_BASE_URL
+        if not base_url:
+            raise CommandError('No base url set, use "--base-url" or the "SNAPSHOT_BASE_URL" setting.')
+
+        result = write_snapshot(snapshot_dir, base_url, workers=options['workers'], force=options['force'])
+
+        for key in result['rendered']:
+            self.stdout.write(f'Rendered {key}', style_func=self.style.SUCCESS)
+
+        for key in result['removed']:
+            self.stdout.write(f'Removed {key}')
+
+        for key, error in result['failed']:
+            self.stderr.write(f'Failed {key}: {error}')
+
+        self.stdout.write(
+            f'{len(result["rendered"])} rendered, {len(result["unchanged"])} unchanged, '
+            f'{len(result["failed"])} failed, {len(result["removed"])} removed.'
+        )
+
+        if result['failed']:
+            raise CommandError('Some previews could not be rendered.')
@@ -1,10 +1,12 @@
 import abc
+import hashlib
 import os
 import re
 from typing import Union
 
 import bleach
 from bleach.css_sanitizer import CSSSanitizer, ALLOWED_CSS_PROPERTIES
+from django.apps import apps
 from django.template import loader, Template, TemplateSyntaxError, Context
 from django.template.backends.django import DjangoTemplates
 from django.template.loader import _engine_list
@@ -72,15 +74,58 @@ try:
 except ModuleNotFoundError as e:
     is_post_office_installed = False
 
-CLASS_REGISTRY = []
+# preview name -> {'cls': preview class, 'metadata': metadata for listings}
+PREVIEW_REGISTRY = {}
+
+
+def _get_app_label(cls) -> str:
+    if apps.apps_ready:
+        app_config = apps.get_containing_app_config(cls.__module__)
+        if app_config:
+            return app_config.label
+    return cls.__module__.rsplit('.', 1)[0]
 
 
 def register(cls):
-    CLASS_REGISTRY.append((cls.__name__, cls))
+    PREVIEW_REGISTRY[cls.__name__] = {
+        'cls': cls,
+        'metadata': {
+            'name': cls.__name__,
+            'app': _get_app_label(cls),
+            'language': cls.language,
+            'is_post_office': cls.is_post_office,
+            'template_name': cls.template_name,
+        },
+    }
+    return cls
 
 
 def get_preview_classes():
-    return CLASS_REGISTRY
+    return [(name, item['cls']) for name, item in PREVIEW_REGISTRY.items()]
+
+
+def get_preview_cls(name):
+    item = PREVIEW_REGISTRY.get(name)
+    return item['cls'] if item else None
+
+
+def get_preview_metadata(app=None, language=None, is_post_office=None, name_prefix=None):
+    """
+    Returns the metadata collected on registration, optionally filtered.
+
+    No preview class is instantiated, so this is safe to call for listings.
+    """
+    result = [item['metadata'] for item in PREVIEW_REGISTRY.values()]
+    if app is not None:
+        result = [item for item in result if item['app'] == app]
+    if language is not None:
+        result = [item for item in result if (item['language'] or '') == language]
+    if is_post_office is not None:
+        result = [item for item in result if item['is_post_office'] == is_post_office]
+    if name_prefix:
+        name_prefix = name_prefix.lower()
+        result = [item for item in result if item['name'].lower().startswith(name_prefix)]
+    return result
 
 
 def extract_subject(template: Template, context=None) -> Union[str, None]:
@@ -101,6 +146,8 @@ class EmailPreview(abc.ABC):
     template_name = None
     is_post_office = False
     language = None
+    # bump this when "get_template_context" changes to invalidate rendered snapshots
+    context_version = None
 
     def __init__(self):
         if not self.template_name:
@@ -205,6 +252,17 @@ class EmailPreview(abc.ABC):
         with open(self.path, 'r') as file:
             return file.read()
 
+    @property
+    def version(self) -> str:
+        """
+        Hash of the template source and the context version, used to detect stale snapshots.
+        """
+        source = self.raw_content
+        if self.is_post_office:
+            source = f'{self.template.subject or ""}\n{source}'
+        key = '\n'.join([self.__class__.__name__, str(self.language), str(self.context_version), source])
+        return hashlib.sha256(key.encode()).hexdigest()
+
     @property
     def template(self) -> Union[EmailTemplate, Template]:
         if self.is_post_office:
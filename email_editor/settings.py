@@ -32,7 +32,11 @@ DEFAULTS = {
         'extended_valid_elements': 'svg[*],defs[*],pattern[*],desc[*],metadata[*],g[*],mask[*],path[*],line[*],marker[*],rect[*],circle[*],ellipse[*],polygon[*],polyline[*],linearGradient[*],radialGradient[*],stop[*],image[*],view[*],text[*],textPath[*],title[*],tspan[*],glyph[*],symbol[*],switch[*],use[*]',
     },
     'WYSIWYG_EDITOR': WYSIWYGEditor.CKEDITOR,
-    'CONTEXT_TREE_MAX_DEPTH': 3
+    'CONTEXT_TREE_MAX_DEPTH': 3,
+    'PREVIEW_LIST_PAGE_SIZE': 50,
+    'PREVIEW_LIST_MAX_PAGE_SIZE': 200,
+    'SNAPSHOT_DIR': None,
+    'SNAPSHOT_BASE_URL': None,
 }
 
 
@@ -81,6 +85,8 @@ class AppSettings:
         for attr in self._cached_attrs:
             delattr(self, attr)
         self._cached_attrs.clear()
+        if hasattr(self, '_user_settings'):
+            delattr(self, '_user_settings')
 
 
 app_settings = AppSettings(None, DEFAULTS)
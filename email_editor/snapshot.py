@@ -0,0 +1,65 @@
+import json
+import os
+from typing import Union
+
+from django.conf import settings
+from django.utils import translation
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+_manifest_cache = {}
+
+
+def get_entry_key(name: str, language: str) -> str:
+    return f'{name}/{language}'
+
+
+def load_manifest(snapshot_dir) -> dict:
+    """
+    Returns the manifest of a snapshot directory, cached until the file changes.
+    """
+    path = os.path.join(snapshot_dir, MANIFEST_NAME)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {'version': MANIFEST_VERSION, 'entries': {}}
+
+    cached = _manifest_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'r', encoding='utf-8') as file:
+        manifest = json.load(file)
+    _manifest_cache[path] = (mtime, manifest)
+    return manifest
+
+
+def read_entry(snapshot_dir, name: str, language: str) -> Union[dict, None]:
+    """
+    Reads a rendered preview from the snapshot, falling back to ``LANGUAGE_CODE``.
+
+    Both languages are matched against the ``LANGUAGES`` codes the snapshot is rendered with,
+    e.g. "en-us" finds the "en" entry.
+    """
+    entries = load_manifest(snapshot_dir)['entries']
+    entry = None
+    for code in (language, settings.LANGUAGE_CODE):
+        try:
+            code = translation.get_supported_language_variant(code)
+        except LookupError:
+            pass
+        entry = entries.get(get_entry_key(name, code))
+        if entry:
+            break
+
+    if not entry:
+        return None
+
+    files = entry['files']
+    with open(os.path.join(snapshot_dir, files['html']), 'r', encoding='utf-8') as file:
+        html = file.read()
+    with open(os.path.join(snapshot_dir, files['subject']), 'r', encoding='utf-8') as file:
+        subject = file.read() or None
+
+    return {'language': entry['language'], 'html': html, 'subject': subject}
@@ -0,0 +1,47 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from email_editor.preview import EmailPreview
+
+
+class PostOfficePreview(EmailPreview):
+    template_name = 'test'
+    is_post_office = True
+
+
+class GermanPreview(EmailPreview):
+    template_name = 'test_project/welcome_mail.html'
+    language = 'de'
+
+    def get_template_context(self, *args, **kwargs):
+        return {}
+
+
+class EnglishPreview(EmailPreview):
+    template_name = 'test_project/welcome_mail.html'
+    language = 'en'
+
+    def get_template_context(self, *args, **kwargs):
+        return {}
+
+
+class AbsoluteUrlPreview(EmailPreview):
+    template_name = 'tests/absolute_url.html'
+
+    def get_template_context(self, *args, **kwargs):
+        return {'items': {'count': 1}}
+
+
+class RegistryTestCase(TestCase):
+    """
+    Runs each test against its own preview registry.
+    """
+
+    def setUp(self):
+        registry_patcher = mock.patch.dict('email_editor.preview.PREVIEW_REGISTRY', clear=True)
+        registry_patcher.start()
+        self.addCleanup(registry_patcher.stop)
+
+        self.staff_user = User.objects.create_user('staff', password='staff', is_staff=True)
@@ -0,0 +1,42 @@
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import translation
+
+from email_editor.preview import register
+from email_editor.tests.previews import RegistryTestCase, EnglishPreview
+
+
+@override_settings(LANGUAGE_CODE='de')
+class PreviewLanguageTestCase(RegistryTestCase):
+
+    def setUp(self):
+        super().setUp()
+        register(EnglishPreview)
+        self.client.force_login(self.staff_user)
+        self.url = reverse('preview-template', kwargs={'preview_cls': 'EnglishPreview'})
+
+    def assertLanguageNotLeaked(self):
+        self.assertNotIn(translation.LANGUAGE_SESSION_KEY, self.client.session)
+        self.assertEqual(translation.get_language(), 'de')
+
+    def test_preview_rendered_in_preview_language(self):
+        translation.activate('de')
+        self.addCleanup(translation.deactivate)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.context['language'], 'en')
+        self.assertIn('Welcome', response.context['html'])
+        self.assertNotIn('Willkommen', response.context['html'])
+        self.assertLanguageNotLeaked()
+
+    def test_api_response_rendered_in_preview_language(self):
+        translation.activate('de')
+        self.addCleanup(translation.deactivate)
+
+        response = self.client.get(self.url, {'api': 1})
+
+        html = response.json()['html']
+        self.assertIn('Welcome', html)
+        self.assertNotIn('Willkommen', html)
+        self.assertLanguageNotLeaked()
@@ -0,0 +1,126 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from email_editor.preview import (
+    register, get_preview_cls, get_preview_classes, get_preview_metadata, EmailPreview
+)
+from email_editor.tests.previews import RegistryTestCase, PostOfficePreview, GermanPreview, EnglishPreview
+from test_project import preview as test_project_preview
+
+
+class RegisterTestCase(TestCase):
+
+    def test_register_returns_class(self):
+        with mock.patch.dict('email_editor.preview.PREVIEW_REGISTRY', clear=True):
+            self.assertIs(register(GermanPreview), GermanPreview)
+
+        self.assertTrue(issubclass(test_project_preview.WelcomeEmailEnPreview, EmailPreview))
+
+    def test_registry_lookup(self):
+        with mock.patch.dict('email_editor.preview.PREVIEW_REGISTRY', clear=True):
+            register(GermanPreview)
+            register(EnglishPreview)
+
+            self.assertIs(get_preview_cls('EnglishPreview'), EnglishPreview)
+            self.assertIsNone(get_preview_cls('Unknown'))
+            self.assertEqual(
+                get_preview_classes(),
+                [('GermanPreview', GermanPreview), ('EnglishPreview', EnglishPreview)]
+            )
+            self.assertEqual([item['name'] for item in get_preview_metadata()], ['GermanPreview', 'EnglishPreview'])
+
+
+class EmailPreviewListViewTestCase(RegistryTestCase):
+
+    def setUp(self):
+        super().setUp()
+        register(test_project_preview.WelcomeEmailEnPreview)
+        register(PostOfficePreview)
+        register(GermanPreview)
+        register(EnglishPreview)
+        self.client.force_login(self.staff_user)
+
+    def get_names(self, **params):
+        response = self.client.get(reverse('preview-list'), params)
+        self.assertEqual(response.status_code, 200)
+        return [item['name'] for item in response.json()['results']]
+
+    def test_list_all(self):
+        self.assertEqual(
+            self.get_names(),
+            ['WelcomeEmailEnPreview', 'PostOfficePreview', 'GermanPreview', 'EnglishPreview']
+        )
+
+    def test_filter_app(self):
+        self.assertEqual(self.get_names(app='test_project'), ['WelcomeEmailEnPreview'])
+
+    def test_filter_language(self):
+        self.assertEqual(self.get_names(language='de'), ['GermanPreview'])
+        self.assertEqual(self.get_names(language=''), ['WelcomeEmailEnPreview', 'PostOfficePreview'])
+
+    def test_filter_is_post_office(self):
+        self.assertEqual(self.get_names(is_post_office='true'), ['PostOfficePreview'])
+        self.assertEqual(
+            self.get_names(is_post_office='false'),
+            ['WelcomeEmailEnPreview', 'GermanPreview', 'EnglishPreview']
+        )
+
+    def test_filter_name_prefix(self):
+        self.assertEqual(self.get_names(q='gErMaN'), ['GermanPreview'])
+        self.assertEqual(self.get_names(q='Preview'), [])
+
+    @override_settings(EMAIL_EDITOR={'PREVIEW_LIST_MAX_PAGE_SIZE': 3})
+    def test_page_size_clamped(self):
+        response = self.client.get(reverse('preview-list'), {'page_size': 100})
+        data = response.json()
+        self.assertEqual(len(data['results']), 3)
+        self.assertEqual(data['num_pages'], 2)
+        self.assertEqual(data['next'], 2)
+
+    def test_page_out_of_range(self):
+        response = self.client.get(reverse('preview-list'), {'page': 5})
+        self.assertEqual(response.status_code, 400)
+
+    def test_index_api_response(self):
+        response = self.client.get(reverse('preview-template'), {'api': 1, 'q': 'english'})
+        self.assertEqual([item['name'] for item in response.json()['results']], ['EnglishPreview'])
+
+    def test_non_staff_forbidden(self):
+        user = User.objects.create_user('user', password='user')
+        self.client.force_login(user)
+        response = self.client.get(reverse('preview-list'))
+        self.assertEqual(response.status_code, 403)
+
+    def test_anonymous_redirects_to_login(self):
+        self.client.logout()
+        response = self.client.get(reverse('preview-list'))
+        self.assertRedirects(response, f'{reverse("admin:login")}?next={reverse("preview-list")}')
+
+
+class EmailTemplatePreviewViewContextTestCase(RegistryTestCase):
+
+    def setUp(self):
+        super().setUp()
+        register(GermanPreview)
+        self.client.force_login(self.staff_user)
+
+    def test_index_without_registry_and_editor_settings(self):
+        response = self.client.get(reverse('preview-template'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['preview_list_url'], reverse('preview-list'))
+        for key in ('preview_cls_list', 'tiny_mce_settings', 'editor_list'):
+            self.assertNotIn(key, response.context)
+
+    def test_tiny_mce_settings_only_for_tinymce(self):
+        url = reverse('preview-template', kwargs={'preview_cls': 'GermanPreview'})
+
+        response = self.client.get(url, {'editor': 'tinymce'})
+        self.assertIn('tiny_mce_settings', response.context)
+        self.assertIn('editor_list', response.context)
+
+        response = self.client.get(url, {'editor': 'ace'})
+        self.assertNotIn('tiny_mce_settings', response.context)
+        self.assertIn('editor_list', response.context)
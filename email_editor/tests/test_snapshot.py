@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import reverse
+
+from email_editor.management.commands import render_preview_snapshot
+from email_editor.management.commands.render_preview_snapshot import write_snapshot
+from email_editor.preview import PREVIEW_REGISTRY, register
+from email_editor.snapshot import MANIFEST_NAME, read_entry
+from email_editor.tests.previews import RegistryTestCase, GermanPreview, AbsoluteUrlPreview
+
+BASE_URL = 'https://mail.example.com/preview/'
+
+
+class SnapshotTestCase(RegistryTestCase):
+
+    def setUp(self):
+        super().setUp()
+        register(GermanPreview)
+        register(AbsoluteUrlPreview)
+
+        self.snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.snapshot_dir)
+
+    def write_snapshot(self, **kwargs):
+        return write_snapshot(self.snapshot_dir, BASE_URL, **kwargs)
+
+    def get_manifest(self):
+        with open(os.path.join(self.snapshot_dir, MANIFEST_NAME), 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def test_write_snapshot(self):
+        all_keys = ['GermanPreview/de', 'AbsoluteUrlPreview/de', 'AbsoluteUrlPreview/en']
+
+        result = self.write_snapshot()
+        self.assertCountEqual(result['rendered'], all_keys)
+        self.assertEqual(result['unchanged'], [])
+
+        result = self.write_snapshot()
+        self.assertEqual(result['rendered'], [])
+        self.assertCountEqual(result['unchanged'], all_keys)
+
+        entry = self.get_manifest()['entries']['AbsoluteUrlPreview/en']
+        self.assertEqual(set(entry['files']), {'html', 'subject', 'context_tree'})
+        self.assertEqual(set(entry['hashes']), {'html', 'subject', 'context_tree'})
+        with open(os.path.join(self.snapshot_dir, entry['files']['context_tree']), 'r', encoding='utf-8') as file:
+            self.assertEqual(json.load(file), {'items': {'count': 1}})
+
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    def test_absolute_urls_use_base_url(self):
+        self.write_snapshot()
+        entry = read_entry(self.snapshot_dir, 'AbsoluteUrlPreview', 'en')
+        self.assertEqual(entry['subject'], 'Absolute')
+        self.assertIn(f'href="{BASE_URL}"', entry['html'])
+        self.assertIn('>mail.example.com<', entry['html'])
+
+    def test_utf8_content(self):
+        self.write_snapshot()
+        entry = self.get_manifest()['entries']['GermanPreview/de']
+        with open(os.path.join(self.snapshot_dir, entry['files']['html']), 'rb') as file:
+            content = file.read()
+
+        self.assertIn('🚘'.encode('utf-8'), content)
+        self.assertEqual(hashlib.sha256(content).hexdigest(), entry['hashes']['html'])
+
+    def test_context_version_changed(self):
+        self.write_snapshot()
+        with mock.patch.object(GermanPreview, 'context_version', 2):
+            result = self.write_snapshot()
+
+        self.assertEqual(result['rendered'], ['GermanPreview/de'])
+
+    def test_catalog_changed(self):
+        self.write_snapshot()
+        with mock.patch.object(render_preview_snapshot, 'get_catalog_version', return_value='changed'):
+            result = self.write_snapshot()
+
+        self.assertCountEqual(
+            result['rendered'],
+            ['GermanPreview/de', 'AbsoluteUrlPreview/de', 'AbsoluteUrlPreview/en']
+        )
+
+    def test_missing_file(self):
+        self.write_snapshot()
+        entry = self.get_manifest()['entries']['AbsoluteUrlPreview/de']
+        os.remove(os.path.join(self.snapshot_dir, entry['files']['html']))
+
+        result = self.write_snapshot()
+        self.assertEqual(result['rendered'], ['AbsoluteUrlPreview/de'])
+
+    def test_failed_render_keeps_previous_entry(self):
+        self.write_snapshot()
+        with mock.patch.object(GermanPreview, 'context_version', 2), \
+                mock.patch.object(GermanPreview, 'render', side_effect=Exception('database unavailable')):
+            result = self.write_snapshot()
+
+        self.assertEqual([key for key, _ in result['failed']], ['GermanPreview/de'])
+        self.assertIn('GermanPreview/de', self.get_manifest()['entries'])
+        self.assertIsNotNone(read_entry(self.snapshot_dir, 'GermanPreview', 'de'))
+
+    def test_unregistered_preview_removed(self):
+        self.write_snapshot()
+        with mock.patch.dict('email_editor.preview.PREVIEW_REGISTRY'):
+            del PREVIEW_REGISTRY['AbsoluteUrlPreview']
+            result = self.write_snapshot()
+
+        self.assertCountEqual(result['removed'], ['AbsoluteUrlPreview/de', 'AbsoluteUrlPreview/en'])
+        self.assertEqual(list(self.get_manifest()['entries']), ['GermanPreview/de'])
+        self.assertFalse(os.path.exists(os.path.join(self.snapshot_dir, 'AbsoluteUrlPreview')))
+
+    def test_read_entry_language_fallback(self):
+        self.write_snapshot()
+        entry = read_entry(self.snapshot_dir, 'AbsoluteUrlPreview', 'fr')
+        self.assertEqual(entry['language'], 'de')
+        self.assertIsNone(read_entry(self.snapshot_dir, 'Unknown', 'de'))
+
+    @override_settings(LANGUAGE_CODE='en-us')
+    def test_read_entry_region_variant(self):
+        self.write_snapshot()
+        self.assertEqual(read_entry(self.snapshot_dir, 'AbsoluteUrlPreview', 'en-us')['language'], 'en')
+        self.assertEqual(read_entry(self.snapshot_dir, 'AbsoluteUrlPreview', 'fr')['language'], 'en')
+        self.assertEqual(read_entry(self.snapshot_dir, 'AbsoluteUrlPreview', 'de-at')['language'], 'de')
+
+    def test_preview_only_serves_snapshot(self):
+        self.write_snapshot()
+        self.client.force_login(self.staff_user)
+
+        with self.settings(EMAIL_EDITOR={'PREVIEW_ONLY': True, 'SNAPSHOT_DIR': self.snapshot_dir}), \
+                mock.patch.object(GermanPreview, 'get_template_context') as get_template_context, \
+                self.assertNumQueries(2):
+            # session and user lookup only
+            response = self.client.get(reverse('preview-template', kwargs={'preview_cls': 'GermanPreview'}))
+
+        get_template_context.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['html'], read_entry(self.snapshot_dir, 'GermanPreview', 'de')['html'])
+        self.assertEqual(response.context['language'], 'de')
+
+    @override_settings(LANGUAGE_CODE='en-us')
+    def test_preview_only_serves_region_variant(self):
+        self.write_snapshot()
+        self.client.force_login(self.staff_user)
+
+        with self.settings(EMAIL_EDITOR={'PREVIEW_ONLY': True, 'SNAPSHOT_DIR': self.snapshot_dir}):
+            response = self.client.get(reverse('preview-template', kwargs={'preview_cls': 'AbsoluteUrlPreview'}))
+
+        self.assertEqual(response.context['errors'], [])
+        self.assertEqual(response.context['language'], 'en')
+        self.assertEqual(response.context['html'], read_entry(self.snapshot_dir, 'AbsoluteUrlPreview', 'en')['html'])
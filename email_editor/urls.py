@@ -1,9 +1,10 @@
 from django.urls import path
 
-from email_editor.views import EmailTemplatePreviewView
+from email_editor.views import EmailTemplatePreviewView, EmailPreviewListView
 
 urlpatterns = [
     path('', EmailTemplatePreviewView.as_view(), name='preview-template'),
+    path('api/previews/', EmailPreviewListView.as_view(), name='preview-list'),
     path('<preview_cls>/', EmailTemplatePreviewView.as_view(), name='preview-template'),
     path('<preview_cls>/<editor>/', EmailTemplatePreviewView.as_view(), name='preview-template'),
 ]
\ No newline at end of file
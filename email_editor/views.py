@@ -2,21 +2,83 @@ import typing
 
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
-from django.http import JsonResponse, HttpResponseBadRequest
+from django.core.paginator import Paginator, InvalidPage
+from django.http import JsonResponse, HttpResponseBadRequest, HttpResponseForbidden
 from django.shortcuts import redirect
 from django.template import TemplateSyntaxError
-from django.urls import reverse
+from django.urls import reverse, reverse_lazy
 from django.utils import translation
 from django.utils.translation import get_language
 from django.views import generic
 
-from email_editor.preview import get_preview_classes
+from email_editor import snapshot
+from email_editor.preview import get_preview_cls, get_preview_metadata
 from email_editor.settings import app_settings, WYSIWYGEditor
 
 if typing.TYPE_CHECKING:
     from email_editor.preview import EmailPreview
 
 
+class EmailPreviewListView(LoginRequiredMixin, generic.View):
+    """
+    Paginated listing of the registered previews, built from the registry metadata.
+
+    Supported GET parameters: ``app``, ``language``, ``is_post_office``, ``q`` (name prefix),
+    ``page`` and ``page_size``.
+    """
+    login_url = reverse_lazy('admin:login')
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+
+        if not request.user.is_staff:
+            return HttpResponseForbidden()
+
+        return super().dispatch(request, *args, **kwargs)
+
+    @staticmethod
+    def _get_bool_param(value):
+        if value is None or value == '':
+            return None
+        return value.lower() in ('1', 'true', 'yes')
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.GET.get('page_size', app_settings.PREVIEW_LIST_PAGE_SIZE))
+        except ValueError:
+            page_size = app_settings.PREVIEW_LIST_PAGE_SIZE
+        return max(1, min(page_size, app_settings.PREVIEW_LIST_MAX_PAGE_SIZE))
+
+    def get_list_data(self, request):
+        items = get_preview_metadata(
+            app=request.GET.get('app') or None,
+            language=request.GET.get('language'),
+            is_post_office=self._get_bool_param(request.GET.get('is_post_office')),
+            name_prefix=request.GET.get('q'),
+        )
+        paginator = Paginator(items, self.get_page_size(request))
+        page = paginator.page(request.GET.get('page') or 1)
+
+        return {
+            'results': [
+                {**item, 'url': reverse('preview-template', kwargs={'preview_cls': item['name']})}
+                for item in page.object_list
+            ],
+            'count': paginator.count,
+            'page': page.number,
+            'num_pages': paginator.num_pages,
+            'next': page.next_page_number() if page.has_next() else None,
+            'previous': page.previous_page_number() if page.has_previous() else None,
+        }
+
+    def get(self, request, *args, **kwargs):
+        try:
+            return JsonResponse(self.get_list_data(request))
+        except InvalidPage:
+            return HttpResponseBadRequest('Invalid page')
+
+
 class EmailTemplatePreviewView(LoginRequiredMixin, generic.TemplateView):
     template_name = 'email_editor/email-preview.html'
     errors = []
@@ -25,6 +87,8 @@ class EmailTemplatePreviewView(LoginRequiredMixin, generic.TemplateView):
 
     def __init__(self, *args, **kwargs):
         self.is_preview_only = app_settings.PREVIEW_ONLY
+        # serve read-only traffic from the rendered snapshot instead of the live previews
+        self.is_snapshot = self.is_preview_only and bool(app_settings.SNAPSHOT_DIR)
         super().__init__(*args, **kwargs)
 
     def render_to_response(self, context, **response_kwargs):
@@ -52,67 +116,98 @@ class EmailTemplatePreviewView(LoginRequiredMixin, generic.TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['preview_cls_list'] = get_preview_classes()
-        context['tiny_mce_settings'] = app_settings.TINY_MCE_INIT
+        context['preview_list_url'] = reverse('preview-list')
+        if not self.preview_cls:
+            return context
+
         context['editor_list'] = [e.value for e in WYSIWYGEditor]
+        if (self.editor or app_settings.WYSIWYG_EDITOR) == WYSIWYGEditor.TINY_MCE:
+            context['tiny_mce_settings'] = app_settings.TINY_MCE_INIT
         return context
 
     def get_preview_cls(self, preview_cls_str):
         if not preview_cls_str or preview_cls_str == "":
             return None
 
-        cls_iter = filter(lambda item: item[0] == preview_cls_str, get_preview_classes())
-        cls = next(cls_iter, None)
+        cls = get_preview_cls(preview_cls_str)
         if not cls:
             raise ObjectDoesNotExist()
-        return cls[1]
+        return cls
 
     def get(self, request, *args, **kwargs):
         is_api_response = request.GET.get('api')
 
         if not self.preview_cls:
+            if is_api_response:
+                return EmailPreviewListView.as_view()(request)
             return self.render_to_response(context=self.get_context_data())
 
         if not self.preview_cls:
             return HttpResponseBadRequest()
 
+        if self.is_snapshot:
+            language, context = self.get_snapshot_context()
+            if is_api_response:
+                return JsonResponse(context)
+
+            return self.render_to_response({
+                'language': language,
+                **context,
+                **self.get_context_data()
+            })
+
         instance = self.preview_cls()     # type: EmailPreview
-        try:
-            html = instance.render(request)
-            subject = instance.subject
-        except TemplateSyntaxError as e:
-            subject = None
-            html = None
-            self.errors.append(e)
-
-        context = {
-            'html': html,
-            'subject': subject,
-            'errors': self.errors,
-            'editor_type': self.editor or app_settings.WYSIWYG_EDITOR
-        }
+        language = instance.language or get_language()
+
+        # activate the preview language for rendering only, without touching the session
+        with translation.override(language):
+            try:
+                html = instance.render(request)
+                subject = instance.subject
+            except TemplateSyntaxError as e:
+                subject = None
+                html = None
+                self.errors.append(e)
 
-        if not self.is_preview_only:
             context = {
-                'context_tree': instance.context_tree,
-                'raw': instance.raw_content,
-                **context
+                'html': html,
+                'subject': subject,
+                'errors': self.errors,
+                'editor_type': self.editor or app_settings.WYSIWYG_EDITOR
             }
 
+            if not self.is_preview_only:
+                context = {
+                    'context_tree': instance.context_tree,
+                    'raw': instance.raw_content,
+                    **context
+                }
+
         if is_api_response:
             return JsonResponse(context)
 
-        # set language
-        if instance.language:
-            translation.activate(instance.language)
-            request.session[translation.LANGUAGE_SESSION_KEY] = instance.language
-
         return self.render_to_response({
-            'language': get_language(),
+            'language': language,
             **context,
             **self.get_context_data()
         })
 
+    def get_snapshot_context(self):
+        name = self.preview_cls.__name__
+        language = self.preview_cls.language or get_language()
+        entry = snapshot.read_entry(app_settings.SNAPSHOT_DIR, name, language)
+        if entry:
+            language = entry['language']
+        else:
+            self.errors.append(f'No snapshot found for "{name}" ({language})')
+
+        return language, {
+            'html': entry['html'] if entry else None,
+            'subject': entry['subject'] if entry else None,
+            'errors': self.errors,
+            'editor_type': self.editor or app_settings.WYSIWYG_EDITOR
+        }
+
     def post(self, request, *args, **kwargs):
         if self.is_preview_only:
             return HttpResponseBadRequest('preview only')
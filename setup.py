@@ -33,7 +33,7 @@ setup(
     version=__version__,
     author='Dominik Lysiak',
     author_email='dominik.lysiak@inquant.de',
-    packages=['email_editor'],
+    packages=['email_editor', 'email_editor.management', 'email_editor.management.commands'],
     url='https://github.com/domlysi/django-email-editor',
     license='MIT',
     description='A faster way to edit and preview templates.',